@@ -6,20 +6,79 @@ This script exports all RAP Pydantic models to JSON Schema 2020-12 format,
 preserving exact $id and $schema values for compatibility.
 """
 
+import copy
+import functools
+import hashlib
+import importlib
 import json
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional, Tuple, Type
 
-# Import all models
-from rap_spec.measurements.base import BaseMeasurement
-from rap_spec.measurements.relaxometry_mri import RelaxometryMRIMeasurement
-from rap_spec.measurements.timeseries import TimeseriesMeasurement
-from rap_spec.data_types.vector_data import VectorData
-from rap_spec.models.research_product import ResearchProduct
-from rap_spec.models.participant import Participant
-from rap_spec.models.collection import ResearchProductCollection
-from rap_spec.models.aggregate import AggregateStatistics
-from rap_spec.models.api_descriptor import ResearchAPIDescriptor
+import pydantic
+from pydantic.json_schema import JsonSchemaMode
+
+import rap_spec
+from rap_spec.models.common import JSON_SCHEMA_DIALECT, SCHEMA_BASE_URL
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None  # type: ignore[assignment]
+
+# Schemas larger than this are written in chunks of WRITE_CHUNK_BYTES
+LARGE_SCHEMA_BYTES = 1 << 20
+WRITE_CHUNK_BYTES = 256 * 1024
+
+# (section, model, output path relative to schemas/v1 and SCHEMA_BASE_URL)
+SCHEMAS: List[Tuple[str, str, str]] = [
+    (
+        "Measurement schemas",
+        "rap_spec.measurements.base.BaseMeasurement",
+        "measurements/base-measurement.json",
+    ),
+    (
+        "Measurement schemas",
+        "rap_spec.measurements.relaxometry_mri.RelaxometryMRIMeasurement",
+        "measurements/relaxometry-mri.json",
+    ),
+    (
+        "Measurement schemas",
+        "rap_spec.measurements.timeseries.TimeseriesMeasurement",
+        "measurements/timeseries.json",
+    ),
+    (
+        "Data type schemas",
+        "rap_spec.data_types.vector_data.VectorData",
+        "data-types/vector-data.json",
+    ),
+    (
+        "Entity schemas",
+        "rap_spec.models.research_product.ResearchProduct",
+        "research-product.json",
+    ),
+    (
+        "Entity schemas",
+        "rap_spec.models.participant.Participant",
+        "participant.json",
+    ),
+    (
+        "Entity schemas",
+        "rap_spec.models.collection.ResearchProductCollection",
+        "collection.json",
+    ),
+    (
+        "Entity schemas",
+        "rap_spec.models.aggregate.AggregateStatistics",
+        "aggregate.json",
+    ),
+    (
+        "Entity schemas",
+        "rap_spec.models.api_descriptor.ResearchAPIDescriptor",
+        "api-descriptor.json",
+    ),
+]
 
 
 def post_process_schema(schema: Dict[str, Any], schema_id: str) -> Dict[str, Any]:
@@ -33,51 +92,171 @@ def post_process_schema(schema: Dict[str, Any], schema_id: str) -> Dict[str, Any
     Returns:
         Post-processed schema
     """
-    # Ensure top-level $schema and $id
-    schema["$schema"] = "https://json-schema.org/draft/2020-12/schema"
-    schema["$id"] = schema_id
-
-    # Remove Pydantic-specific keys that shouldn't be in JSON Schema
-    keys_to_remove = ["additionalProperties"]
-    for key in keys_to_remove:
-        schema.pop(key, None)
+    # json_schema_extra already sets $schema/$id on every published model, so
+    # only touch them when a model's metadata is missing or disagrees.
+    if schema.get("$id") != schema_id or not schema.get("$schema"):
+        schema["$schema"] = JSON_SCHEMA_DIALECT
+        schema["$id"] = schema_id
 
-    # Set additionalProperties to false for strict validation (except where needed)
-    if "properties" in schema:
-        # ResearchProduct should have additionalProperties: false
-        if "ResearchProduct" in schema.get("title", ""):
-            schema["additionalProperties"] = False
+    # ResearchProduct should have additionalProperties: false
+    if "ResearchProduct" in schema.get("title", ""):
+        schema["additionalProperties"] = False
 
     return schema
 
 
-def generate_schema(model_class: Any, output_path: Path, schema_id: str) -> None:
+@functools.lru_cache(maxsize=None)
+def _cached_json_schema(
+    model_class: Type[pydantic.BaseModel],
+    mode: JsonSchemaMode = "serialization",
+    by_alias: bool = True,
+) -> Dict[str, Any]:
+    """Generate the JSON schema for a model at most once per process."""
+    return model_class.model_json_schema(mode=mode, by_alias=by_alias)
+
+
+def schema_cache_key(model_class: Any, schema_id: str) -> str:
+    """
+    Compute a cross-process cache key for a model's generated schema.
+
+    The output is fully determined by the rap_spec sources, this script and
+    the Pydantic version, so those are hashed rather than the core schema
+    repr, which embeds per-process object ids, omits field descriptions and
+    is mutated as other models' schemas are built.
+
+    Args:
+        model_class: The Pydantic model class
+        schema_id: The $id for this schema
+
+    Returns:
+        Hex digest identifying the model's schema inputs
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    model_name = f"{model_class.__module__}.{model_class.__qualname__}"
+    for part in (pydantic.VERSION, model_name, schema_id):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    digest.update(_package_source_digest())
+    return digest.hexdigest()
+
+
+@functools.lru_cache(maxsize=None)
+def _package_source_digest() -> bytes:
+    """Digest of every rap_spec source file and of this script's post-processing."""
+    package_dir = Path(rap_spec.__file__).parent
+    digest = hashlib.blake2b(digest_size=16)
+    for source_path in sorted(package_dir.rglob("*.py")):
+        digest.update(source_path.relative_to(package_dir).as_posix().encode("utf-8"))
+        digest.update(source_path.read_bytes())
+    digest.update(Path(__file__).read_bytes())
+    return digest.digest()
+
+
+def serialize_schema(schema: Dict[str, Any]) -> bytes:
+    """
+    Serialize a schema to its on-disk representation.
+
+    Args:
+        schema: The JSON schema to serialize
+
+    Returns:
+        UTF-8 encoded JSON with 2-space indentation and a trailing newline
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            schema,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS,
+        )
+    return (json.dumps(schema, indent=2, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def write_file(path: Path, payload: bytes) -> None:
+    """
+    Write a file with a single write() syscall in the common case.
+
+    Bypasses Python's buffered file objects; short writes are retried.
+    Payloads larger than LARGE_SCHEMA_BYTES are written in WRITE_CHUNK_BYTES
+    slices through a buffered writer instead of one oversized write().
+
+    Args:
+        path: Destination file, created or truncated
+        payload: Complete file contents
+    """
+    if len(payload) > LARGE_SCHEMA_BYTES:
+        view = memoryview(payload)
+        with open(path, "wb", buffering=WRITE_CHUNK_BYTES) as f:
+            for start in range(0, len(view), WRITE_CHUNK_BYTES):
+                f.write(view[start : start + WRITE_CHUNK_BYTES])
+        return
+
+    # O_BINARY (Windows only) stops the C runtime translating \n to \r\n
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    fd = os.open(path, flags, 0o644)
+    try:
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
+
+
+def generate_schema(
+    model_class: Any,
+    output_path: Path,
+    schema_id: str,
+    cache_dir: Optional[Path] = None,
+) -> Tuple[Path, bytes, bool]:
     """
     Generate JSON Schema for a Pydantic model.
 
+    The schema file itself is not written here; main() writes every payload
+    in one pass once all models have been generated.
+
     Args:
         model_class: The Pydantic model class
-        output_path: Path to write the schema file
+        output_path: Path the schema file will be written to
         schema_id: The $id for this schema
+        cache_dir: Directory of previously generated schemas, keyed by
+            core schema hash. Disabled when None.
+
+    Returns:
+        Tuple of (output_path, serialized schema, whether it came from the cache)
     """
-    # Generate schema using Pydantic v2 API
-    schema = model_class.model_json_schema(
-        mode="serialization",
-        by_alias=True,
-    )
+    cache_path = None
+    if cache_dir is not None:
+        cache_path = cache_dir / f"{schema_cache_key(model_class, schema_id)}.json"
+        if cache_path.is_file():
+            return output_path, cache_path.read_bytes(), True
+
+    # Models declare defer_build=True; only build the core schema on a cache miss
+    model_class.model_rebuild()
+
+    # Generate schema using Pydantic v2 API; copy so post-processing never
+    # mutates the memoized result
+    schema = copy.deepcopy(_cached_json_schema(model_class))
 
     # Post-process schema
     schema = post_process_schema(schema, schema_id)
 
-    # Ensure output directory exists
-    output_path.parent.mkdir(parents=True, exist_ok=True)
+    payload = serialize_schema(schema)
+
+    if cache_path is not None:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        write_file(cache_path, payload)
 
-    # Write schema file
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(schema, f, indent=2, ensure_ascii=False)
-        f.write("\n")  # Add trailing newline
+    return output_path, payload, False
 
-    print(f"✓ Generated: {output_path}")
+
+def import_model(dotted_name: str) -> Any:
+    """Import a model class from its dotted path."""
+    module_name, _, class_name = dotted_name.rpartition(".")
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def _generate_one(job: Tuple[str, Path, str, Optional[Path]]) -> Tuple[Path, bytes, bool]:
+    """Process pool entry point; imports the model by name so classes are never pickled."""
+    model_name, output_path, schema_id, cache_dir = job
+    return generate_schema(import_model(model_name), output_path, schema_id, cache_dir)
 
 
 def main() -> None:
@@ -85,62 +264,32 @@ def main() -> None:
     # Base directory
     repo_root = Path(__file__).parent.parent
     schemas_dir = repo_root / "schemas" / "v1"
+    cache_dir = schemas_dir / ".cache"
 
     print("Generating JSON Schemas from Pydantic models...\n")
 
-    # Measurement schemas
-    print("Measurement schemas:")
-    generate_schema(
-        BaseMeasurement,
-        schemas_dir / "measurements" / "base-measurement.json",
-        "https://rap-spec.evidencepub.io/v1/schemas/measurements/base-measurement.json",
-    )
-    generate_schema(
-        RelaxometryMRIMeasurement,
-        schemas_dir / "measurements" / "relaxometry-mri.json",
-        "https://rap-spec.evidencepub.io/v1/schemas/measurements/relaxometry-mri.json",
-    )
-    generate_schema(
-        TimeseriesMeasurement,
-        schemas_dir / "measurements" / "timeseries.json",
-        "https://rap-spec.evidencepub.io/v1/schemas/measurements/timeseries.json",
-    )
-
-    # Data type schemas
-    print("\nData type schemas:")
-    generate_schema(
-        VectorData,
-        schemas_dir / "data-types" / "vector-data.json",
-        "https://rap-spec.evidencepub.io/v1/schemas/data-types/vector-data.json",
-    )
-
-    # Entity schemas
-    print("\nEntity schemas:")
-    generate_schema(
-        ResearchProduct,
-        schemas_dir / "research-product.json",
-        "https://rap-spec.evidencepub.io/v1/schemas/research-product.json",
-    )
-    generate_schema(
-        Participant,
-        schemas_dir / "participant.json",
-        "https://rap-spec.evidencepub.io/v1/schemas/participant.json",
-    )
-    generate_schema(
-        ResearchProductCollection,
-        schemas_dir / "collection.json",
-        "https://rap-spec.evidencepub.io/v1/schemas/collection.json",
-    )
-    generate_schema(
-        AggregateStatistics,
-        schemas_dir / "aggregate.json",
-        "https://rap-spec.evidencepub.io/v1/schemas/aggregate.json",
-    )
-    generate_schema(
-        ResearchAPIDescriptor,
-        schemas_dir / "api-descriptor.json",
-        "https://rap-spec.evidencepub.io/v1/schemas/api-descriptor.json",
-    )
+    # Models are independent, so build them in parallel
+    jobs = [
+        (model_name, schemas_dir / relative_path, SCHEMA_BASE_URL + relative_path, cache_dir)
+        for _, model_name, relative_path in SCHEMAS
+    ]
+    with ProcessPoolExecutor(max_workers=min(len(jobs), os.cpu_count() or 1)) as executor:
+        results = list(executor.map(_generate_one, jobs))
+
+    # Write every schema in one batch, with no progress output interleaved
+    for output_path, payload, _ in results:
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        write_file(output_path, payload)
+
+    # Report in declaration order once everything has finished
+    current_section = None
+    for (section, _, _), (output_path, _, cached) in zip(SCHEMAS, results):
+        if section != current_section:
+            if current_section is not None:
+                print()
+            print(f"{section}:")
+            current_section = section
+        print(f"✓ Generated: {output_path}{' (cached)' if cached else ''}")
 
     print("\n✅ All schemas generated successfully!")
     print(f"   Output directory: {schemas_dir}")
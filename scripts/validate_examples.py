@@ -3,24 +3,99 @@
 Validate example data files using Pydantic models.
 
 This script validates all example JSON-LD files against their corresponding
-Pydantic models to ensure the examples conform to the specification.
+Pydantic models to ensure the examples conform to the specification. When
+jsonschema is installed (the "validation" extra), examples are also checked
+against the published JSON Schemas.
 """
 
+import functools
 import json
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from pydantic import TypeAdapter
 
 from rap_spec.models.research_product import ResearchProduct
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    orjson = None  # type: ignore[assignment]
+
+try:
+    from jsonschema import Draft202012Validator
+    from jsonschema.exceptions import best_match
+    from referencing import Registry, Resource
+except ImportError:  # jsonschema is optional; skip JSON Schema checks
+    Draft202012Validator = None
+
+SCHEMAS_DIR = Path(__file__).parent.parent / "schemas" / "v1"
+RESEARCH_PRODUCT_SCHEMA = SCHEMAS_DIR / "research-product.json"
+
+# Compiled JSON Schema validators, keyed by schema path
+_VALIDATORS: Dict[Path, Callable[[Any], None]] = {}
+
+# Built once and reused for every example file
+_RESEARCH_PRODUCT_ADAPTER: TypeAdapter[ResearchProduct] = TypeAdapter(ResearchProduct)
+
 
 def load_json_file(file_path: Path) -> Dict[str, Any]:
     """Load a JSON/JSON-LD file."""
-    with open(file_path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    data = file_path.read_bytes()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+@functools.lru_cache(maxsize=None)
+def _schema_registry() -> "Registry":
+    """Registry of every published schema, so cross-schema $id references resolve."""
+    resources = []
+    for schema_path in sorted(SCHEMAS_DIR.rglob("*.json")):
+        # Skip generate_schemas.py's hash-keyed cache; its entries duplicate
+        # the published $ids
+        if ".cache" in schema_path.relative_to(SCHEMAS_DIR).parts:
+            continue
+        schema = load_json_file(schema_path)
+        resources.append((schema["$id"], Resource.from_contents(schema)))
+    return Registry().with_resources(resources)
+
+
+def get_validator(schema_path: Path) -> Optional[Callable[[Any], None]]:
+    """
+    Get the compiled JSON Schema validator for a schema file.
+
+    Validators are built on first use and cached for the life of the process.
+
+    Args:
+        schema_path: Path to the JSON Schema file
+
+    Returns:
+        Callable raising ValueError for non-conforming documents, or None if
+        jsonschema is not installed
+    """
+    if Draft202012Validator is None:
+        return None
+
+    validator = _VALIDATORS.get(schema_path)
+    if validator is None:
+        compiled = Draft202012Validator(
+            load_json_file(schema_path), registry=_schema_registry()
+        )
+
+        def check(instance: Any) -> None:
+            error = best_match(compiled.iter_errors(instance))
+            if error is not None:
+                raise ValueError(f"JSON Schema ({error.json_path}): {error.message}")
+
+        validator = _VALIDATORS[schema_path] = check
+    return validator
 
 
-def validate_research_product(file_path: Path) -> bool:
+def validate_research_product(file_path: Path) -> Tuple[bool, str]:
     """
     Validate a research product example file.
 
@@ -28,18 +103,19 @@ def validate_research_product(file_path: Path) -> bool:
         file_path: Path to the JSON-LD file
 
     Returns:
-        True if valid, False otherwise
+        Tuple of (True if valid, False otherwise) and the report to print
     """
     try:
         data = load_json_file(file_path)
+        # Check against the published JSON Schema before Pydantic sees it
+        schema_validator = get_validator(RESEARCH_PRODUCT_SCHEMA)
+        if schema_validator is not None:
+            schema_validator(data)
         # Validate using Pydantic
-        product = ResearchProduct.model_validate(data)
-        print(f"✓ Valid: {file_path.name}")
-        return True
+        _RESEARCH_PRODUCT_ADAPTER.validate_python(data)
+        return True, f"✓ Valid: {file_path.name}"
     except Exception as e:
-        print(f"✗ Invalid: {file_path.name}")
-        print(f"  Error: {e}")
-        return False
+        return False, f"✗ Invalid: {file_path.name}\n  Error: {e}"
 
 
 def main() -> int:
@@ -47,7 +123,10 @@ def main() -> int:
     repo_root = Path(__file__).parent.parent
     examples_dir = repo_root / "examples"
 
-    print("Validating example files using Pydantic models...\n")
+    print("Validating example files using Pydantic models...")
+    if Draft202012Validator is None:
+        print("(jsonschema not installed; skipping JSON Schema checks)")
+    print()
 
     # Find all .jsonld files
     example_files = list(examples_dir.rglob("*.jsonld"))
@@ -59,12 +138,16 @@ def main() -> int:
     valid_count = 0
     invalid_count = 0
 
-    for example_file in sorted(example_files):
-        # Determine type based on file content or location
-        if validate_research_product(example_file):
-            valid_count += 1
-        else:
-            invalid_count += 1
+    # Validate files in parallel; map() yields results in input order
+    max_workers = min(len(example_files), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        results = executor.map(validate_research_product, sorted(example_files), chunksize=8)
+        for valid, report in results:
+            print(report)
+            if valid:
+                valid_count += 1
+            else:
+                invalid_count += 1
 
     print(f"\n{'='*60}")
     print(f"Results: {valid_count} valid, {invalid_count} invalid")
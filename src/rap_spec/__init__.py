@@ -4,17 +4,35 @@ Research API Protocol (RAP) Specification
 JSON Schema definitions for standardizing research data products, queries, and APIs.
 """
 
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List
+
 __version__ = "1.0.0"
 
-from rap_spec.models.research_product import ResearchProduct
-from rap_spec.models.participant import Participant
-from rap_spec.models.collection import ResearchProductCollection
-from rap_spec.models.aggregate import AggregateStatistics
-from rap_spec.models.api_descriptor import ResearchAPIDescriptor
-from rap_spec.measurements.base import BaseMeasurement
-from rap_spec.measurements.relaxometry_mri import RelaxometryMRIMeasurement
-from rap_spec.measurements.timeseries import TimeseriesMeasurement
-from rap_spec.data_types.vector_data import VectorData
+if TYPE_CHECKING:
+    from rap_spec.models.research_product import ResearchProduct
+    from rap_spec.models.participant import Participant
+    from rap_spec.models.collection import ResearchProductCollection
+    from rap_spec.models.aggregate import AggregateStatistics
+    from rap_spec.models.api_descriptor import ResearchAPIDescriptor
+    from rap_spec.measurements.base import BaseMeasurement
+    from rap_spec.measurements.relaxometry_mri import RelaxometryMRIMeasurement
+    from rap_spec.measurements.timeseries import TimeseriesMeasurement
+    from rap_spec.data_types.vector_data import VectorData
+
+# Public models are imported on first attribute access (PEP 562), so importing
+# the package does not build every model's schema up front.
+_LAZY_IMPORTS: Dict[str, str] = {
+    "ResearchProduct": "rap_spec.models.research_product",
+    "Participant": "rap_spec.models.participant",
+    "ResearchProductCollection": "rap_spec.models.collection",
+    "AggregateStatistics": "rap_spec.models.aggregate",
+    "ResearchAPIDescriptor": "rap_spec.models.api_descriptor",
+    "BaseMeasurement": "rap_spec.measurements.base",
+    "RelaxometryMRIMeasurement": "rap_spec.measurements.relaxometry_mri",
+    "TimeseriesMeasurement": "rap_spec.measurements.timeseries",
+    "VectorData": "rap_spec.data_types.vector_data",
+}
 
 __all__ = [
     "ResearchProduct",
@@ -27,3 +45,17 @@ __all__ = [
     "TimeseriesMeasurement",
     "VectorData",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import public models lazily on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value  # Cache so later lookups bypass __getattr__
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
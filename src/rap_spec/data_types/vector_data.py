@@ -1,14 +1,20 @@
 """Vector data schema for 1D numeric arrays."""
 
-from typing import Any, Dict, List, Literal, Optional, Union
-from pydantic import BaseModel, ConfigDict, Field, HttpUrl
-from rap_spec.models.common import Unit
+import math
+from typing import Any, Dict, List, Literal, Optional, Sequence
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    model_validator,
+)
+from rap_spec.models.common import NonEmptyFloatArray, UnitOrUrl, schema_metadata, type_tag
 
 
 class Statistics(BaseModel):
     """Summary statistics for the vector."""
 
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
 
     mean: Optional[float] = Field(None, description="Mean value")
     median: Optional[float] = Field(None, description="Median value")
@@ -17,6 +23,23 @@ class Statistics(BaseModel):
     max: Optional[float] = Field(None, description="Maximum value")
     count: Optional[int] = Field(None, description="Number of values")
 
+    @classmethod
+    def from_values(cls, values: Sequence[float]) -> "Statistics":
+        """Compute statistics for a non-empty sequence (population standard deviation)."""
+        count = len(values)
+        mean = math.fsum(values) / count
+        ordered = sorted(values)
+        middle = count // 2
+        median = ordered[middle] if count % 2 else (ordered[middle - 1] + ordered[middle]) / 2
+        return cls(
+            mean=mean,
+            median=median,
+            std=math.sqrt(math.fsum((value - mean) ** 2 for value in values) / count),
+            min=ordered[0],
+            max=ordered[-1],
+            count=count,
+        )
+
 
 class VectorData(BaseModel):
     """Schema for vector data (1D array of values).
@@ -26,26 +49,23 @@ class VectorData(BaseModel):
 
     model_config = ConfigDict(
         populate_by_name=True,
-        json_schema_extra={
-            "$schema": "https://json-schema.org/draft/2020-12/schema",
-            "$id": "https://rap-spec.evidencepub.io/v1/schemas/data-types/vector-data.json",
-        },
+        defer_build=True,
+        json_schema_extra=schema_metadata("data-types/vector-data.json"),
     )
 
-    type_: Literal["VectorData"] = Field(default="VectorData", alias="@type")
-    values: List[float] = Field(
+    type_: Literal["VectorData"] = type_tag("VectorData")
+    values: NonEmptyFloatArray = Field(
         ...,
-        min_length=1,
         description="Array of numeric values",
     )
-    unit: Union[Unit, HttpUrl] = Field(
+    unit: UnitOrUrl = Field(
         ...,
         description="Unit of measurement for all values",
     )
     length: Optional[int] = Field(
         None,
         ge=1,
-        description="Number of elements in the vector",
+        description="Number of elements in the vector (computed from values if omitted)",
     )
     labels: Optional[List[str]] = Field(
         None,
@@ -53,9 +73,21 @@ class VectorData(BaseModel):
     )
     statistics: Optional[Statistics] = Field(
         None,
-        description="Summary statistics for the vector",
+        description="Summary statistics for the vector (computed from values if omitted)",
     )
     metadata: Optional[Dict[str, Any]] = Field(
         None,
         description="Additional metadata about the vector",
     )
+
+    @model_validator(mode="after")
+    def _derive_summary(self) -> "VectorData":
+        # Supplied values may describe a larger dataset than the values
+        # shipped (see examples/), so only derive them when absent. Derived
+        # statistics are stored once, as if supplied, so every dump mode and
+        # equality check sees the same state.
+        if self.length is None:
+            self.length = len(self.values)
+        if self.statistics is None:
+            self.statistics = Statistics.from_values(self.values)
+        return self
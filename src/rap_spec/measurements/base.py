@@ -1,8 +1,8 @@
 """Base measurement schema for all measurement types."""
 
-from typing import Literal, Optional, Union
+from typing import Literal, Optional
 from pydantic import BaseModel, ConfigDict, Field, HttpUrl
-from rap_spec.models.common import Unit
+from rap_spec.models.common import TYPE_ALIAS, UnitOrUrl, schema_metadata
 
 
 class BaseMeasurement(BaseModel):
@@ -13,15 +13,13 @@ class BaseMeasurement(BaseModel):
 
     model_config = ConfigDict(
         populate_by_name=True,
-        json_schema_extra={
-            "$schema": "https://json-schema.org/draft/2020-12/schema",
-            "$id": "https://rap-spec.evidencepub.io/v1/schemas/measurements/base-measurement.json",
-        },
+        defer_build=True,
+        json_schema_extra=schema_metadata("measurements/base-measurement.json"),
     )
 
     type_: Literal["Measurement"] = Field(
         default="Measurement",
-        alias="@type",
+        alias=TYPE_ALIAS,
         description="Type identifier for measurements",
     )
     measurement_type: str = Field(
@@ -38,7 +36,7 @@ class BaseMeasurement(BaseModel):
         None,
         description="Session identifier for longitudinal studies",
     )
-    unit: Optional[Union[Unit, HttpUrl]] = Field(
+    unit: Optional[UnitOrUrl] = Field(
         None,
         description="Unit of measurement",
     )
@@ -3,13 +3,14 @@
 from typing import List, Literal, Optional, Union
 from pydantic import BaseModel, ConfigDict, Field
 from rap_spec.measurements.base import BaseMeasurement
-from rap_spec.models.common import Unit
+from rap_spec.models.common import Unit, schema_metadata
+from rap_spec.models.enums import RegionType
 
 
 class SpatialResolution(BaseModel):
     """Spatial resolution of the measurement."""
 
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
 
     value: float = Field(..., ge=0, description="Resolution value")
     unit: Unit = Field(..., description="Unit of spatial resolution")
@@ -18,7 +19,7 @@ class SpatialResolution(BaseModel):
 class FieldStrength(BaseModel):
     """Magnetic field strength."""
 
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
 
     value: float = Field(..., ge=0, description="Field strength value")
     unit: Unit = Field(..., description="Field strength unit")
@@ -27,7 +28,7 @@ class FieldStrength(BaseModel):
 class AcquisitionParameters(BaseModel):
     """MRI acquisition parameters."""
 
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
 
     field_strength: Optional[FieldStrength] = Field(
         None, alias="fieldStrength", description="Magnetic field strength"
@@ -58,10 +59,8 @@ class RelaxometryMRIMeasurement(BaseMeasurement):
 
     model_config = ConfigDict(
         populate_by_name=True,
-        json_schema_extra={
-            "$schema": "https://json-schema.org/draft/2020-12/schema",
-            "$id": "https://rap-spec.evidencepub.io/v1/schemas/measurements/relaxometry-mri.json",
-        },
+        defer_build=True,
+        json_schema_extra=schema_metadata("measurements/relaxometry-mri.json"),
     )
 
     measurement_type: Literal["relaxometry_mri"] = Field(
@@ -81,7 +80,7 @@ class RelaxometryMRIMeasurement(BaseMeasurement):
         description="Anatomical region measured",
         examples=["gray_matter", "white_matter", "hippocampus", "cortex"],
     )
-    region_type: Optional[Literal["tissue_class", "anatomical_roi", "functional_roi", "voxel_wise"]] = Field(
+    region_type: Optional[RegionType] = Field(
         None,
         alias="regionType",
         description="Type of region definition",
@@ -3,13 +3,13 @@
 from typing import List, Literal, Optional
 from pydantic import BaseModel, ConfigDict, Field
 from rap_spec.measurements.base import BaseMeasurement
-from rap_spec.models.common import Unit
+from rap_spec.models.common import Unit, schema_metadata
 
 
 class TimeDimension(BaseModel):
     """Time dimension information."""
 
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
 
     length: int = Field(..., ge=1, description="Number of time points")
     start: Optional[float] = Field(None, description="Start time")
@@ -19,7 +19,7 @@ class TimeDimension(BaseModel):
 class Dimensions(BaseModel):
     """Dimensions of the timeseries data."""
 
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
 
     time: Optional[TimeDimension] = Field(None, description="Time dimension information")
 
@@ -27,7 +27,7 @@ class Dimensions(BaseModel):
 class SamplingRate(BaseModel):
     """Sampling rate of the timeseries."""
 
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
 
     value: float = Field(..., gt=0, description="Sampling rate value")
     unit: Unit = Field(..., description="Sampling rate unit")
@@ -36,7 +36,7 @@ class SamplingRate(BaseModel):
 class Duration(BaseModel):
     """Total duration of the timeseries."""
 
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
 
     value: float = Field(..., ge=0, description="Duration value")
     unit: Unit = Field(..., description="Duration unit")
@@ -45,7 +45,7 @@ class Duration(BaseModel):
 class Channels(BaseModel):
     """Channel information for multi-channel timeseries."""
 
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
 
     count: int = Field(..., ge=1, description="Number of channels")
     type_: Optional[str] = Field(None, alias="type", description="Type of channels")
@@ -60,10 +60,8 @@ class TimeseriesMeasurement(BaseMeasurement):
 
     model_config = ConfigDict(
         populate_by_name=True,
-        json_schema_extra={
-            "$schema": "https://json-schema.org/draft/2020-12/schema",
-            "$id": "https://rap-spec.evidencepub.io/v1/schemas/measurements/timeseries.json",
-        },
+        defer_build=True,
+        json_schema_extra=schema_metadata("measurements/timeseries.json"),
     )
 
     measurement_type: Literal["timeseries"] = Field(
@@ -0,0 +1,16 @@
+"""Mixins shared by the top-level JSON-LD entity models."""
+
+from typing import Any, Dict, Literal, Union
+from pydantic import Field
+from rap_spec.models.common import CONTEXT_ALIAS, _RAPBase
+
+
+class JsonLdEntityMixin(_RAPBase):
+    """JSON-LD ``@context`` field shared by the top-level entities.
+
+    Subclasses declare their own ``@type`` literal and a described ``@id``.
+    """
+
+    context: Union[Literal["https://rap-spec.evidencepub.io/v1/context"], Dict[str, Any]] = Field(
+        ..., alias=CONTEXT_ALIAS, frozen=True
+    )
@@ -1,20 +1,32 @@
 """Aggregate statistics schema."""
 
-from typing import Any, Dict, List, Literal, Optional, Union
+from typing import Dict, List, Literal, Optional, Tuple, Union
 from pydantic import BaseModel, ConfigDict, Field, HttpUrl
+from rap_spec.models._mixins import JsonLdEntityMixin
+from rap_spec.models.common import ID_ALIAS, FloatArray, URLStr, schema_metadata, type_tag
+from rap_spec.models.enums import AdjustmentMethod, EffectSizeMeasure, StatisticalTestMethod
+
+
+class AgeRange(BaseModel):
+    """Age range filter bounds."""
+
+    model_config = ConfigDict(populate_by_name=True, defer_build=True, extra="forbid")
+
+    min: Optional[float] = Field(None, description="Minimum age")
+    max: Optional[float] = Field(None, description="Maximum age")
 
 
 class AggregateFilters(BaseModel):
     """Filters applied before aggregation."""
 
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
 
     participant: Optional[Union[str, List[str]]] = Field(
         None, description="Participant filter(s)"
     )
     session: Optional[Union[str, List[str]]] = Field(None, description="Session filter(s)")
     group: Optional[str] = Field(None, description="Group filter")
-    age_range: Optional[Dict[str, float]] = Field(
+    age_range: Optional[AgeRange] = Field(
         None, alias="ageRange", description="Age range filter"
     )
 
@@ -22,7 +34,7 @@ class AggregateFilters(BaseModel):
 class MeanValue(BaseModel):
     """Mean value with optional units."""
 
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
 
     value: float = Field(..., description="Mean value")
     units: Optional[str] = Field(None, description="Units")
@@ -31,7 +43,7 @@ class MeanValue(BaseModel):
 class QuantileValues(BaseModel):
     """Quantile values."""
 
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
 
     q25: Optional[float] = Field(None, description="25th percentile")
     q50: Optional[float] = Field(None, description="50th percentile (median)")
@@ -41,7 +53,7 @@ class QuantileValues(BaseModel):
 class ConfidenceInterval(BaseModel):
     """Confidence interval."""
 
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
 
     level: float = Field(
         ...,
@@ -56,7 +68,7 @@ class ConfidenceInterval(BaseModel):
 class Statistics(BaseModel):
     """Statistical measures."""
 
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
 
     mean: Optional[Union[float, MeanValue]] = Field(None, description="Mean value")
     median: Optional[float] = Field(None, description="Median value")
@@ -65,9 +77,7 @@ class Statistics(BaseModel):
     variance: Optional[float] = Field(None, description="Variance")
     min: Optional[float] = Field(None, description="Minimum value")
     max: Optional[float] = Field(None, description="Maximum value")
-    range: Optional[List[float]] = Field(
-        None, min_length=2, max_length=2, description="Range [min, max]"
-    )
+    range: Optional[Tuple[float, float]] = Field(None, description="Range [min, max]")
     quantiles: Optional[QuantileValues] = Field(None, description="Quantile values")
     confidence_interval: Optional[ConfidenceInterval] = Field(
         None, alias="confidenceInterval", description="Confidence interval"
@@ -77,25 +87,25 @@ class Statistics(BaseModel):
 class Histogram(BaseModel):
     """Histogram distribution."""
 
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
 
-    bins: Optional[List[float]] = Field(None, description="Histogram bin edges")
+    bins: Optional[FloatArray] = Field(None, description="Histogram bin edges")
     counts: Optional[List[int]] = Field(None, description="Counts per bin")
 
 
 class KDE(BaseModel):
     """Kernel density estimate."""
 
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
 
-    x: Optional[List[float]] = Field(None, description="X values")
-    y: Optional[List[float]] = Field(None, description="Y values (density)")
+    x: Optional[FloatArray] = Field(None, description="X values")
+    y: Optional[FloatArray] = Field(None, description="Y values (density)")
 
 
 class Distribution(BaseModel):
     """Distribution information."""
 
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
 
     histogram: Optional[Histogram] = Field(None, description="Histogram distribution")
     kde: Optional[KDE] = Field(None, description="Kernel density estimate")
@@ -104,7 +114,7 @@ class Distribution(BaseModel):
 class AggregateLinks(BaseModel):
     """Links to related resources."""
 
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
 
     products: Optional[HttpUrl] = Field(
         None, description="Link to products in this group"
@@ -117,7 +127,7 @@ class AggregateLinks(BaseModel):
 class AggregateGroup(BaseModel):
     """Aggregate results for a single group."""
 
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
 
     participant: Optional[str] = Field(None, description="Participant ID")
     session: Optional[str] = Field(None, description="Session ID")
@@ -136,7 +146,7 @@ class AggregateGroup(BaseModel):
 class ComparisonGroup(BaseModel):
     """Group being compared."""
 
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
 
     name: Optional[str] = Field(None, description="Group name")
     participant_count: Optional[int] = Field(
@@ -150,22 +160,18 @@ class ComparisonGroup(BaseModel):
 class EffectSize(BaseModel):
     """Effect size measure."""
 
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
 
-    measure: Literal["cohensD", "hedgesG", "glassD", "eta-squared", "omega-squared"] = Field(
-        ..., description="Effect size measure type"
-    )
+    measure: EffectSizeMeasure = Field(..., description="Effect size measure type")
     value: float = Field(..., description="Effect size value")
 
 
 class StatisticalTest(BaseModel):
     """Statistical test results."""
 
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
 
-    method: Literal["t-test", "anova", "mann-whitney", "kruskal-wallis", "chi-square"] = Field(
-        ..., description="Statistical test used"
-    )
+    method: StatisticalTestMethod = Field(..., description="Statistical test used")
     statistic: float = Field(..., description="Test statistic value")
     p_value: float = Field(
         ..., ge=0, le=1, alias="pValue", description="P-value"
@@ -187,7 +193,7 @@ class StatisticalTest(BaseModel):
 class PostHocComparison(BaseModel):
     """Post-hoc pairwise comparison."""
 
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
 
     group1: Optional[str] = Field(None, description="First group")
     group2: Optional[str] = Field(None, description="Second group")
@@ -195,7 +201,7 @@ class PostHocComparison(BaseModel):
     adjusted: Optional[bool] = Field(
         None, description="Whether p-value is adjusted for multiple comparisons"
     )
-    adjustment_method: Optional[Literal["bonferroni", "holm", "fdr_bh", "fdr_by"]] = Field(
+    adjustment_method: Optional[AdjustmentMethod] = Field(
         None, alias="adjustmentMethod", description="Adjustment method used"
     )
 
@@ -203,7 +209,7 @@ class PostHocComparison(BaseModel):
 class Comparison(BaseModel):
     """Statistical comparison between groups."""
 
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
 
     groups: Optional[List[ComparisonGroup]] = Field(
         None, description="Groups being compared"
@@ -217,7 +223,7 @@ class Comparison(BaseModel):
 class AggregateMetadata(BaseModel):
     """Additional metadata about the aggregation."""
 
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
 
     computed_at: Optional[str] = Field(
         None, alias="computedAt", description="When these statistics were computed"
@@ -232,27 +238,23 @@ class AggregateMetadata(BaseModel):
     )
 
 
-class AggregateStatistics(BaseModel):
+class AggregateStatistics(JsonLdEntityMixin):
     """Aggregated statistics across multiple research products.
 
     Provides group-level statistics, distributions, and statistical comparisons.
     """
 
+    # Unknown keys are ignored like in the nested aggregate models, rather
+    # than forbidden as on the other JsonLdEntityMixin entities
     model_config = ConfigDict(
         populate_by_name=True,
-        json_schema_extra={
-            "$schema": "https://json-schema.org/draft/2020-12/schema",
-            "$id": "https://rap-spec.evidencepub.io/v1/schemas/aggregate.json",
-        },
+        defer_build=True,
+        extra="ignore",
+        json_schema_extra=schema_metadata("aggregate.json"),
     )
 
-    context: Union[Literal["https://rap-spec.evidencepub.io/v1/context"], Dict[str, Any]] = Field(
-        ..., alias="@context"
-    )
-    type_: Literal["AggregateStatistics"] = Field(
-        default="AggregateStatistics", alias="@type"
-    )
-    id_: HttpUrl = Field(..., alias="@id", description="URI of this aggregate query")
+    type_: Literal["AggregateStatistics"] = type_tag("AggregateStatistics")
+    id_: URLStr = Field(..., alias=ID_ALIAS, description="URI of this aggregate query")
     measure: str = Field(..., description="The measurement type being aggregated")
     grouping: Optional[str] = Field(
         None,
@@ -1,78 +1,66 @@
 """Research API descriptor schema."""
 
-from typing import List, Literal, Optional
-from pydantic import BaseModel, ConfigDict, Field, HttpUrl
+from typing import Annotated, List, Literal, Optional, Tuple
+from pydantic import ConfigDict, Field, StringConstraints
+from rap_spec.models.common import CONTEXT_ALIAS, URLStr, _RAPBase, schema_metadata, type_tag
 
 
-class Paper(BaseModel):
-    """Paper metadata."""
+# Patterns are kept as strings so pydantic-core compiles them once with its
+# Rust regex engine; a compiled re.Pattern would force the Python re fallback.
+DOI = Annotated[str, StringConstraints(pattern=r"^10\.\d{4,}/[\S]+$")]
+SemVer = Annotated[str, StringConstraints(pattern=r"^\d+\.\d+\.\d+$")]
+MajorMinorVersion = Annotated[str, StringConstraints(pattern=r"^\d+\.\d+$")]
 
-    model_config = ConfigDict(populate_by_name=True)
+HttpMethod = Literal["GET", "POST", "PUT", "DELETE"]
 
-    doi: str = Field(
-        ...,
-        pattern=r"^10\.\d{4,}/[\S]+$",
-        description="DOI of the paper",
-    )
+
+class Paper(_RAPBase):
+    """Paper metadata."""
+
+    doi: DOI = Field(..., description="DOI of the paper")
     title: str = Field(..., description="Paper title")
-    authors: Optional[List[str]] = Field(None, description="List of authors")
+    authors: Optional[Tuple[str, ...]] = Field(None, description="List of authors")
     publication_date: Optional[str] = Field(
         None, alias="publicationDate", description="Publication date"
     )
 
 
-class API(BaseModel):
+class API(_RAPBase):
     """API version and configuration."""
 
-    model_config = ConfigDict(populate_by_name=True)
-
-    version: str = Field(
-        ...,
-        pattern=r"^\d+\.\d+\.\d+$",
-        description="API version (semver)",
-    )
-    rap_spec_version: str = Field(
-        ...,
-        alias="rapSpecVersion",
-        pattern=r"^\d+\.\d+$",
-        description="RAP specification version",
+    version: SemVer = Field(..., description="API version (semver)")
+    rap_spec_version: MajorMinorVersion = Field(
+        ..., alias="rapSpecVersion", description="RAP specification version"
     )
-    base_url: HttpUrl = Field(..., alias="baseUrl", description="API base URL")
-    documentation: Optional[HttpUrl] = Field(None, description="API documentation URL")
+    base_url: URLStr = Field(..., alias="baseUrl", description="API base URL")
+    documentation: Optional[URLStr] = Field(None, description="API documentation URL")
 
 
-class Endpoint(BaseModel):
+class Endpoint(_RAPBase):
     """API endpoint definition."""
 
-    model_config = ConfigDict(populate_by_name=True)
-
     path: str = Field(..., description="Endpoint path")
-    methods: List[Literal["GET", "POST", "PUT", "DELETE"]] = Field(
+    methods: List[HttpMethod] = Field(
         ..., description="Supported HTTP methods"
     )
     description: Optional[str] = Field(None, description="Endpoint description")
 
 
-class ResearchAPIDescriptor(BaseModel):
+class ResearchAPIDescriptor(_RAPBase):
     """Discovery metadata for a RAP-compliant API.
 
     Provides metadata about the research paper, API configuration, and available endpoints.
     """
 
     model_config = ConfigDict(
-        populate_by_name=True,
-        json_schema_extra={
-            "$schema": "https://json-schema.org/draft/2020-12/schema",
-            "$id": "https://rap-spec.evidencepub.io/v1/schemas/api-descriptor.json",
-        },
+        defer_build=True,
+        json_schema_extra=schema_metadata("api-descriptor.json"),
     )
 
     context: Literal["https://rap-spec.evidencepub.io/v1/context"] = Field(
-        ..., alias="@context"
-    )
-    type_: Literal["ResearchAPIDescriptor"] = Field(
-        default="ResearchAPIDescriptor", alias="@type"
+        ..., alias=CONTEXT_ALIAS, frozen=True
     )
+    type_: Literal["ResearchAPIDescriptor"] = type_tag("ResearchAPIDescriptor")
     paper: Paper = Field(..., description="Paper metadata")
     api: API = Field(..., description="API configuration")
     endpoints: List[Endpoint] = Field(..., description="Available API endpoints")
@@ -1,55 +1,70 @@
 """Research product collection schema."""
 
-from typing import Any, Dict, List, Literal, Optional, Union
-from pydantic import BaseModel, ConfigDict, Field, HttpUrl
+import functools
+from typing import (
+    Annotated,
+    Any,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+from pydantic import ConfigDict, Discriminator, Field, Tag, TypeAdapter, ValidationError
+from pydantic.dataclasses import dataclass
+from rap_spec.models._mixins import JsonLdEntityMixin
+from rap_spec.models.common import (
+    FilterList,
+    ID_ALIAS,
+    OpaqueDict,
+    ProcessingLevel,
+    URLStr,
+    _RAPBase,
+    _VALUE_CONFIG,
+    schema_metadata,
+    type_tag,
+)
 from rap_spec.models.research_product import ResearchProduct
 
 
-class AppliedFilters(BaseModel):
+class AppliedFilters(_RAPBase):
     """Currently applied filters."""
 
-    model_config = ConfigDict(populate_by_name=True)
-
-    participant: Optional[Union[str, List[str]]] = Field(
-        None, description="Participant ID filter(s)"
-    )
-    measure: Optional[Union[str, List[str]]] = Field(
-        None, description="Measurement type filter(s)"
-    )
-    session: Optional[Union[str, List[str]]] = Field(
-        None, description="Session filter(s)"
+    participant: FilterList = None
+    """Participant ID filter(s)"""
+    measure: FilterList = None
+    """Measurement type filter(s)"""
+    session: FilterList = None
+    """Session filter(s)"""
+    group: Optional[str] = None
+    """Group filter"""
+    processing_level: Optional[ProcessingLevel] = Field(
+        None, alias="processingLevel", description="Processing level filter"
     )
-    group: Optional[str] = Field(None, description="Group filter")
-    processing_level: Optional[
-        Literal["raw", "preprocessed", "analysis_ready", "aggregated"]
-    ] = Field(None, alias="processingLevel", description="Processing level filter")
 
 
-class AvailableFilters(BaseModel):
+class AvailableFilters(_RAPBase):
     """All available filter values."""
 
-    model_config = ConfigDict(populate_by_name=True)
-
-    participant: Optional[List[str]] = Field(
-        None, description="List of all participant IDs"
-    )
-    measure: Optional[List[str]] = Field(
-        None, description="List of all measurement types"
-    )
-    session: Optional[List[str]] = Field(None, description="List of all session types")
-    group: Optional[List[str]] = Field(
-        None, description="List of all experimental groups"
-    )
-    processing_level: Optional[List[str]] = Field(
+    participant: Optional[Tuple[str, ...]] = None
+    """List of all participant IDs"""
+    measure: Optional[Tuple[str, ...]] = None
+    """List of all measurement types"""
+    session: Optional[Tuple[str, ...]] = None
+    """List of all session types"""
+    group: Optional[Tuple[str, ...]] = None
+    """List of all experimental groups"""
+    processing_level: Optional[Tuple[str, ...]] = Field(
         None, alias="processingLevel", description="List of all processing levels"
     )
 
 
-class Filter(BaseModel):
+class Filter(_RAPBase):
     """Information about applied and available filters."""
 
-    model_config = ConfigDict(populate_by_name=True)
-
     applied: Optional[AppliedFilters] = Field(
         None, description="Currently applied filters"
     )
@@ -58,45 +73,55 @@ class Filter(BaseModel):
     )
 
 
-class ProductSummary(BaseModel):
+class ProductSummary(_RAPBase):
     """Brief summary of a research product."""
 
-    model_config = ConfigDict(populate_by_name=True)
-
-    type_: Literal["ResearchProduct"] = Field(
-        default="ResearchProduct", alias="@type"
-    )
-    id_: HttpUrl = Field(..., alias="@id", description="Product URI")
+    type_: Literal["ResearchProduct"] = type_tag("ResearchProduct")
+    id_: URLStr = Field(..., alias=ID_ALIAS, description="Product URI")
     identifier: str = Field(..., description="Product identifier")
-    participant: Optional[Dict[str, Any]] = Field(
+    participant: Optional[OpaqueDict] = Field(
         None, description="Participant reference"
     )
-    measurement: Optional[Dict[str, Any]] = Field(
+    measurement: Optional[OpaqueDict] = Field(
         None, description="Measurement metadata"
     )
-    summary: Optional[Dict[str, Any]] = Field(
+    summary: Optional[OpaqueDict] = Field(
         None, description="Brief summary of the product"
     )
-    distribution: Optional[Dict[str, Any]] = Field(
+    distribution: Optional[OpaqueDict] = Field(
         None, description="Distribution information"
     )
 
 
-class PaginationLinks(BaseModel):
-    """Pagination links."""
+def _member_tag(value: Any) -> str:
+    """Tell full products from summaries; both use @type "ResearchProduct".
 
-    model_config = ConfigDict(populate_by_name=True)
+    Only full products carry ``productType``, so its presence selects the variant.
+    """
+    if isinstance(value, dict):
+        return "product" if "productType" in value or "product_type" in value else "summary"
+    return "product" if isinstance(value, ResearchProduct) else "summary"
 
-    first: Optional[HttpUrl] = Field(None, description="First page link")
-    prev: Optional[HttpUrl] = Field(None, description="Previous page link")
-    next: Optional[HttpUrl] = Field(None, description="Next page link")
-    last: Optional[HttpUrl] = Field(None, description="Last page link")
 
+# Collection member, dispatched on _member_tag instead of trying each variant in turn
+CollectionMember = Annotated[
+    Union[Annotated[ResearchProduct, Tag("product")], Annotated[ProductSummary, Tag("summary")]],
+    Discriminator(_member_tag),
+]
+
+
+@dataclass(config=_VALUE_CONFIG, frozen=True, slots=True)
+class PaginationLinks:
+    """Pagination links."""
+
+    first: Optional[URLStr] = Field(None, description="First page link")
+    prev: Optional[URLStr] = Field(None, description="Previous page link")
+    next: Optional[URLStr] = Field(None, description="Next page link")
+    last: Optional[URLStr] = Field(None, description="Last page link")
 
-class Pagination(BaseModel):
-    """Pagination information for large collections."""
 
-    model_config = ConfigDict(populate_by_name=True)
+class Pagination(_RAPBase):
+    """Pagination information for large collections."""
 
     page: Optional[int] = Field(None, ge=1, description="Current page number")
     page_size: Optional[int] = Field(
@@ -108,36 +133,29 @@ class Pagination(BaseModel):
     links: Optional[PaginationLinks] = Field(None, description="Pagination links")
 
 
-class SortedBy(BaseModel):
+@dataclass(config=_VALUE_CONFIG, frozen=True, slots=True)
+class SortedBy:
     """Current sort order."""
 
-    model_config = ConfigDict(populate_by_name=True)
-
     field: Optional[str] = Field(None, description="Field name being sorted by")
     order: Optional[Literal["asc", "desc"]] = Field(None, description="Sort order")
 
 
-class ResearchProductCollection(BaseModel):
+class ResearchProductCollection(JsonLdEntityMixin):
     """A collection of research products with filtering capabilities.
 
     Supports filtering, pagination, and sorting of research products.
     """
 
     model_config = ConfigDict(
-        populate_by_name=True,
-        json_schema_extra={
-            "$schema": "https://json-schema.org/draft/2020-12/schema",
-            "$id": "https://rap-spec.evidencepub.io/v1/schemas/collection.json",
-        },
+        defer_build=True,
+        json_schema_extra=schema_metadata("collection.json"),
     )
 
-    context: Union[Literal["https://rap-spec.evidencepub.io/v1/context"], Dict[str, Any]] = Field(
-        ..., alias="@context"
-    )
-    type_: Literal["ResearchProductCollection"] = Field(
-        default="ResearchProductCollection", alias="@type"
+    type_: Literal["ResearchProductCollection"] = type_tag(
+        "ResearchProductCollection"
     )
-    id_: HttpUrl = Field(..., alias="@id", description="URI of this collection")
+    id_: URLStr = Field(..., alias=ID_ALIAS, description="URI of this collection")
     total_items: int = Field(
         ...,
         ge=0,
@@ -147,7 +165,7 @@ class ResearchProductCollection(BaseModel):
     filter: Optional[Filter] = Field(
         None, description="Information about applied and available filters"
     )
-    member: List[Union[ResearchProduct, ProductSummary]] = Field(
+    member: List[CollectionMember] = Field(
         ..., description="Array of research products in this collection"
     )
     pagination: Optional[Pagination] = Field(
@@ -156,3 +174,60 @@ class ResearchProductCollection(BaseModel):
     sorted_by: Optional[SortedBy] = Field(
         None, alias="sortedBy", description="Current sort order"
     )
+
+    @classmethod
+    def iter_members(
+        cls, raw_members: Iterable[Any]
+    ) -> Iterator[Union[ResearchProduct, ProductSummary]]:
+        """Validate raw collection members lazily, one per step of the iterator.
+
+        Pass the unvalidated ``member`` array of a response (e.g. ``doc["member"]``)
+        when only some members are needed: each element is validated only when the
+        iterator reaches it, instead of validating the whole page up front.
+        """
+        adapter = _member_adapter()
+        for item in raw_members:
+            yield adapter.validate_python(item)
+
+
+@functools.lru_cache(maxsize=None)
+def _member_adapter() -> TypeAdapter[Union[ResearchProduct, ProductSummary]]:
+    """Shared validator for a single collection member, built on first use."""
+    return TypeAdapter(CollectionMember)
+
+
+@functools.lru_cache(maxsize=None)
+def _product_list_adapter() -> TypeAdapter[List[ResearchProduct]]:
+    """Shared list validator for lists holding only full products, built on first use."""
+    return TypeAdapter(List[ResearchProduct])
+
+
+@functools.lru_cache(maxsize=None)
+def _summary_list_adapter() -> TypeAdapter[List[ProductSummary]]:
+    """Shared list validator for lists holding only product summaries, built on first use."""
+    return TypeAdapter(List[ProductSummary])
+
+
+@functools.lru_cache(maxsize=None)
+def _mixed_list_adapter() -> TypeAdapter[List[Union[ResearchProduct, ProductSummary]]]:
+    """Shared list validator for the tagged CollectionMember union, built on first use."""
+    return TypeAdapter(List[CollectionMember])
+
+
+def validate_members(raw: Sequence[Any]) -> Sequence[Union[ResearchProduct, ProductSummary]]:
+    """Validate a bare list of collection members outside a collection envelope.
+
+    The first member picks a single-type list validator, so pages holding only
+    full products or only summaries skip per-member dispatch; mixed lists fall
+    back to the tagged CollectionMember union.
+    """
+    if not raw:
+        return []
+    try:
+        if _member_tag(raw[0]) == "product":
+            return _product_list_adapter().validate_python(raw)
+        return _summary_list_adapter().validate_python(raw)
+    except ValidationError:
+        # Mixed (or invalid) members: the union validates each against its own
+        # type, so errors are reported against the right model
+        return _mixed_list_adapter().validate_python(raw)
@@ -1,68 +1,229 @@
 """Common types and models shared across the RAP specification."""
 
-from typing import Any, Dict, List, Literal, Optional, Union
-from pydantic import BaseModel, ConfigDict, Field, HttpUrl
+from array import array
+from typing import (
+    Annotated,
+    Any,
+    Dict,
+    Final,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
+from pydantic import (
+    AfterValidator,
+    BaseModel,
+    BeforeValidator,
+    ConfigDict,
+    Field,
+    HttpUrl,
+    PlainSerializer,
+    PlainValidator,
+    StringConstraints,
+    WithJsonSchema,
+)
+from pydantic.config import JsonDict
+from pydantic_core import PydanticCustomError
+from pydantic.dataclasses import dataclass
+
+
+JSON_SCHEMA_DIALECT = "https://json-schema.org/draft/2020-12/schema"
+SCHEMA_BASE_URL = "https://rap-spec.evidencepub.io/v1/schemas/"
+
+
+def schema_metadata(path: str) -> JsonDict:
+    """``$schema`` and ``$id`` of a published schema, for ``json_schema_extra``.
+
+    Args:
+        path: Schema path relative to SCHEMA_BASE_URL
+    """
+    return {"$schema": JSON_SCHEMA_DIALECT, "$id": SCHEMA_BASE_URL + path}
+
+
+def _to_float_array(values: Sequence[float]) -> "array[float]":
+    """Store validated floats in a contiguous float64 buffer."""
+    return array("d", values)
+
+
+def _float_array_to_list(values: Sequence[float]) -> List[float]:
+    # Not array.tolist(): model_construct, model_copy(update=...) and attribute
+    # assignment bypass validation and may store a plain list
+    return list(values)
+
+
+# Numeric vectors: validated as a list of floats, stored as array("d") (8 bytes
+# per element instead of a list of float objects) and serialized back to a list.
+FloatArray = Annotated[
+    Sequence[float],
+    AfterValidator(_to_float_array),
+    PlainSerializer(_float_array_to_list, return_type=List[float]),
+]
+NonEmptyFloatArray = Annotated[
+    Sequence[float],
+    Field(min_length=1),
+    AfterValidator(_to_float_array),
+    PlainSerializer(
+        _float_array_to_list, return_type=Annotated[List[float], Field(min_length=1)]
+    ),
+]
+
+def _require_dict(value: Any) -> Dict[str, Any]:
+    """Accept any dict as-is, without validating its keys or values."""
+    if not isinstance(value, dict):
+        raise PydanticCustomError("dict_type", "Input should be a valid dictionary")
+    return value
+
+
+# Free-form JSON object passed through as-is: only checked to be a dict, never
+# walked key by key.
+OpaqueDict = Annotated[
+    Dict[str, Any], PlainValidator(_require_dict), WithJsonSchema({"type": "object"})
+]
+
+# Closed vocabularies shared by several models. Kept as Literal aliases so
+# pydantic-core checks membership natively and the schemas list them as enums.
+ProcessingLevel = Literal["raw", "preprocessed", "analysis_ready", "aggregated"]
+Sex = Literal["M", "F", "other", "unknown"]
+# Participant identifier (e.g. sub-01, P001), shared by Participant and the
+# ParticipantReference embedded in research products. A plain string pattern
+# keeps validation on pydantic-core's Rust regex engine.
+ParticipantID = Annotated[str, StringConstraints(pattern=r"^[A-Za-z0-9_-]+$", max_length=64)]
+
+
+def _as_tuple(value: Any) -> Any:
+    """Wrap a single filter value so every filter validates as a tuple."""
+    return (value,) if isinstance(value, str) else value
+
+
+# Optional filter accepting one value or several; always stored as a tuple, so
+# validation never has to try a str-or-list union. The schema still documents
+# both input forms.
+FilterList = Annotated[
+    Optional[Tuple[str, ...]],
+    BeforeValidator(_as_tuple),
+    WithJsonSchema(
+        {
+            "anyOf": [
+                {"type": "string"},
+                {"items": {"type": "string"}, "type": "array"},
+                {"type": "null"},
+            ]
+        }
+    ),
+]
+
+
+# JSON-LD keyword aliases, defined once and shared by every model
+TYPE_ALIAS: Final = "@type"
+ID_ALIAS: Final = "@id"
+CONTEXT_ALIAS: Final = "@context"
 
 
-class Unit(BaseModel):
-    """Unit of measurement (QUDT-compatible structure)."""
+def type_tag(name: str) -> Any:
+    """Field for a model's constant JSON-LD ``@type``, defaulting to ``name``."""
+    return Field(default=name, alias=TYPE_ALIAS, frozen=True)
+
+
+_ModelT = TypeVar("_ModelT", bound="_RAPBase")
+
+
+class _RAPBase(BaseModel):
+    """Base for RAP models.
+
+    Fields are populated by name or by alias. Fields without other constraints
+    are documented with attribute docstrings, which become their descriptions.
+    """
+
+    model_config = ConfigDict(
+        extra="forbid", populate_by_name=True, use_attribute_docstrings=True
+    )
 
-    model_config = ConfigDict(populate_by_name=True)
+    @classmethod
+    def from_json_bytes(cls: Type[_ModelT], data: Union[bytes, bytearray]) -> _ModelT:
+        """Validate a raw JSON document, e.g. an HTTP response body.
+
+        Pass the bytes as received rather than the output of ``json.loads``:
+        pydantic-core parses and validates in one pass without building an
+        intermediate dict tree.
+        """
+        return cls.model_validate_json(data)
+
+
+# Config shared by the small immutable value objects: pydantic dataclasses with
+# _RAPBase's alias handling, declared frozen and slotted (no per-instance
+# __dict__). pydantic ignores slots on Python 3.9. Attribute docstrings are not
+# read for dataclasses, so their fields keep Field(description=...). Constant
+# @type fields are defaulted and therefore declared after the required fields.
+_VALUE_CONFIG = ConfigDict(extra="forbid", populate_by_name=True)
+
+
+# http(s) URL checked syntactically and kept as the original string, rather than
+# parsed and normalized into a pydantic Url object. Published as the same JSON
+# Schema that HttpUrl produces.
+URLStr = Annotated[
+    str,
+    StringConstraints(max_length=2083, pattern=r"^https?://[^\s]+$"),
+    WithJsonSchema({"format": "uri", "maxLength": 2083, "minLength": 1, "type": "string"}),
+]
+
+
+@dataclass(config=_VALUE_CONFIG, frozen=True, slots=True)
+class Unit:
+    """Unit of measurement (QUDT-compatible structure)."""
 
-    type_: Literal["Unit"] = Field(default="Unit", alias="@type")
     symbol: str = Field(..., description="Unit symbol (e.g., ms, Hz)")
     label: Optional[str] = Field(None, description="Human-readable unit label")
-    uri: Optional[HttpUrl] = Field(None, description="QUDT unit URI")
+    uri: Optional[URLStr] = Field(None, description="QUDT unit URI")
+    type_: Literal["Unit"] = Field(default="Unit", alias=TYPE_ALIAS)
 
 
-class QuantityValue(BaseModel):
-    """A quantity with a value and unit."""
+# A structured unit or a bare QUDT unit URL; shared so every field that accepts
+# either reuses one union definition.
+UnitOrUrl = Union[Unit, HttpUrl]
 
-    model_config = ConfigDict(populate_by_name=True)
 
-    type_: Literal["QuantityValue"] = Field(default="QuantityValue", alias="@type")
+@dataclass(config=_VALUE_CONFIG, frozen=True, slots=True)
+class QuantityValue:
+    """A quantity with a value and unit."""
+
     value: float = Field(..., ge=0, description="Numeric value")
     unit: str = Field(..., description="Unit of measurement")
+    type_: Literal["QuantityValue"] = Field(default="QuantityValue", alias=TYPE_ALIAS)
 
 
-class SoftwareApplication(BaseModel):
+class SoftwareApplication(_RAPBase):
     """Software application metadata."""
 
-    model_config = ConfigDict(populate_by_name=True)
-
-    type_: Literal["SoftwareApplication"] = Field(
-        default="SoftwareApplication", alias="@type"
-    )
+    type_: Literal["SoftwareApplication"] = type_tag("SoftwareApplication")
     name: str = Field(..., description="Software name")
     version: Optional[str] = Field(None, description="Software version")
-    url: Optional[HttpUrl] = Field(None, description="Software URL")
+    url: Optional[URLStr] = Field(None, description="Software URL")
 
 
-class ProcessingStep(BaseModel):
+class ProcessingStep(_RAPBase):
     """A single step in the data processing pipeline."""
 
-    model_config = ConfigDict(populate_by_name=True)
-
-    type_: Literal["ProcessingStep"] = Field(default="ProcessingStep", alias="@type")
+    type_: Literal["ProcessingStep"] = type_tag("ProcessingStep")
     step_order: int = Field(..., ge=1, alias="stepOrder", description="Step order in pipeline")
     name: str = Field(..., description="Step name")
     software_agent: Optional[SoftwareApplication] = Field(
         None, alias="softwareAgent", description="Software used for this step"
     )
-    parameters: Optional[Dict[str, Any]] = Field(
+    parameters: Optional[OpaqueDict] = Field(
         None, description="Processing parameters"
     )
 
 
-class ProcessingProvenance(BaseModel):
+class ProcessingProvenance(_RAPBase):
     """Provenance tracking for data processing pipeline."""
 
-    model_config = ConfigDict(populate_by_name=True)
-
-    type_: Literal["ProcessingProvenance"] = Field(
-        default="ProcessingProvenance", alias="@type"
-    )
-    was_derived_from: Dict[str, Any] = Field(
+    type_: Literal["ProcessingProvenance"] = type_tag("ProcessingProvenance")
+    was_derived_from: OpaqueDict = Field(
         ...,
         alias="wasDerivedFrom",
         description="Source data this was derived from",
@@ -72,36 +233,31 @@ class ProcessingProvenance(BaseModel):
     )
 
 
-class ComputeEnvironment(BaseModel):
+class ComputeEnvironment(_RAPBase):
     """Computational environment information."""
 
-    model_config = ConfigDict(populate_by_name=True)
-
-    type_: Literal["ComputeEnvironment"] = Field(
-        default="ComputeEnvironment", alias="@type"
-    )
-    container_image: Optional[Dict[str, Any]] = Field(
+    type_: Literal["ComputeEnvironment"] = type_tag("ComputeEnvironment")
+    container_image: Optional[OpaqueDict] = Field(
         None, alias="containerImage", description="Container image information"
     )
 
 
-class CreativeWork(BaseModel):
+class CreativeWork(_RAPBase):
     """Creative work (for licenses)."""
 
-    model_config = ConfigDict(populate_by_name=True)
-
-    type_: Literal["CreativeWork"] = Field(default="CreativeWork", alias="@type")
-    id_: HttpUrl = Field(..., alias="@id", description="License URI")
+    type_: Literal["CreativeWork"] = type_tag("CreativeWork")
+    id_: URLStr = Field(..., alias=ID_ALIAS, description="License URI")
     name: Optional[str] = Field(None, description="License name")
 
 
-class DataDownload(BaseModel):
+class DataDownload(_RAPBase):
     """Distribution/download information."""
 
-    model_config = ConfigDict(populate_by_name=True)
+    # Distributions commonly carry further schema.org properties (e.g. description)
+    model_config = ConfigDict(extra="allow")
 
-    type_: Literal["DataDownload"] = Field(default="DataDownload", alias="@type")
-    content_url: HttpUrl = Field(..., alias="contentUrl", description="Download URL")
+    type_: Literal["DataDownload"] = type_tag("DataDownload")
+    content_url: URLStr = Field(..., alias="contentUrl", description="Download URL")
     encoding_format: Optional[str] = Field(
         None, alias="encodingFormat", description="File format (MIME type)"
     )
@@ -110,23 +266,19 @@ class DataDownload(BaseModel):
     )
 
 
-class PropertyValue(BaseModel):
+class PropertyValue(_RAPBase):
     """Property value (used for identifiers like DOI)."""
 
-    model_config = ConfigDict(populate_by_name=True)
-
-    type_: Literal["PropertyValue"] = Field(default="PropertyValue", alias="@type")
+    type_: Literal["PropertyValue"] = type_tag("PropertyValue")
     property_id: str = Field(..., alias="propertyID", description="Property identifier")
     value: str = Field(..., description="Property value")
 
 
-class ScholarlyArticle(BaseModel):
+class ScholarlyArticle(_RAPBase):
     """Scholarly article citation."""
 
-    model_config = ConfigDict(populate_by_name=True)
-
-    type_: Literal["ScholarlyArticle"] = Field(default="ScholarlyArticle", alias="@type")
-    identifier: Optional[Dict[str, Any]] = Field(
+    type_: Literal["ScholarlyArticle"] = type_tag("ScholarlyArticle")
+    identifier: Optional[OpaqueDict] = Field(
         None, description="Article identifier (e.g., DOI)"
     )
     name: Optional[str] = Field(None, description="Article title")
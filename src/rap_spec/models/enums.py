@@ -0,0 +1,41 @@
+"""Enumerations shared across the RAP specification."""
+
+from enum import Enum
+
+
+class RegionType(str, Enum):
+    """How a measured region is defined."""
+
+    TISSUE_CLASS = "tissue_class"
+    ANATOMICAL_ROI = "anatomical_roi"
+    FUNCTIONAL_ROI = "functional_roi"
+    VOXEL_WISE = "voxel_wise"
+
+
+class EffectSizeMeasure(str, Enum):
+    """Effect size measure type."""
+
+    COHENS_D = "cohensD"
+    HEDGES_G = "hedgesG"
+    GLASS_D = "glassD"
+    ETA_SQUARED = "eta-squared"
+    OMEGA_SQUARED = "omega-squared"
+
+
+class StatisticalTestMethod(str, Enum):
+    """Statistical test used for a group comparison."""
+
+    T_TEST = "t-test"
+    ANOVA = "anova"
+    MANN_WHITNEY = "mann-whitney"
+    KRUSKAL_WALLIS = "kruskal-wallis"
+    CHI_SQUARE = "chi-square"
+
+
+class AdjustmentMethod(str, Enum):
+    """Multiple-comparison p-value adjustment method."""
+
+    BONFERRONI = "bonferroni"
+    HOLM = "holm"
+    FDR_BH = "fdr_bh"
+    FDR_BY = "fdr_by"
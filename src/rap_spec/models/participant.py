@@ -1,38 +1,49 @@
 """Participant schema."""
 
-from typing import Any, Dict, List, Literal, Optional, Union
-from pydantic import BaseModel, ConfigDict, Field, HttpUrl, field_validator
-
-
-class Age(BaseModel):
+from typing import Dict, List, Literal, Optional, Tuple
+from pydantic import ConfigDict, Field
+from pydantic.dataclasses import dataclass
+from rap_spec.models._mixins import JsonLdEntityMixin
+from rap_spec.models.common import (
+    ID_ALIAS,
+    ParticipantID,
+    Sex,
+    TYPE_ALIAS,
+    URLStr,
+    _RAPBase,
+    _VALUE_CONFIG,
+    schema_metadata,
+    type_tag,
+)
+
+
+@dataclass(config=_VALUE_CONFIG, frozen=True, slots=True)
+class Age:
     """Age information."""
 
-    model_config = ConfigDict(populate_by_name=True)
-
-    type_: Literal["QuantityValue"] = Field(default="QuantityValue", alias="@type")
     value: float = Field(..., ge=0, description="Age value")
     unit: str = Field(default="YR", description="Unit of age (typically YR for years)")
+    type_: Literal["QuantityValue"] = Field(default="QuantityValue", alias=TYPE_ALIAS)
 
 
-class DemographicData(BaseModel):
+class DemographicData(_RAPBase):
     """Demographic and experimental group information."""
 
-    model_config = ConfigDict(populate_by_name=True)
-
-    age: Optional[Age] = Field(None, description="Participant age")
-    sex: Optional[Literal["M", "F", "other", "unknown"]] = Field(
-        None, description="Biological sex"
-    )
-    gender: Optional[str] = Field(None, description="Gender identity")
+    age: Optional[Age] = None
+    """Participant age"""
+    sex: Optional[Sex] = None
+    """Biological sex"""
+    gender: Optional[str] = None
+    """Gender identity"""
     group: Optional[str] = Field(
         None,
         description="Experimental group assignment",
         examples=["experimental", "control", "treatment_a", "treatment_b"],
     )
-    ethnicity: Optional[str] = Field(None, description="Self-reported ethnicity")
-    handedness: Optional[Literal["left", "right", "ambidextrous", "unknown"]] = Field(
-        None, description="Handedness"
-    )
+    ethnicity: Optional[str] = None
+    """Self-reported ethnicity"""
+    handedness: Optional[Literal["left", "right", "ambidextrous", "unknown"]] = None
+    """Handedness"""
     species: Optional[str] = Field(
         default="human",
         description="Species (for animal studies)",
@@ -50,50 +61,42 @@ class DemographicData(BaseModel):
     )
 
 
-class Medication(BaseModel):
+class Medication(_RAPBase):
     """Medication history entry."""
 
-    model_config = ConfigDict(populate_by_name=True)
-
     name: Optional[str] = Field(None, description="Medication name")
     dosage: Optional[str] = Field(None, description="Dosage")
     duration: Optional[str] = Field(None, description="Duration of use")
 
 
-class Assessment(BaseModel):
+class Assessment(_RAPBase):
     """Clinical assessment entry."""
 
-    model_config = ConfigDict(populate_by_name=True)
-
     name: Optional[str] = Field(None, description="Assessment name")
     score: Optional[float] = Field(None, description="Assessment score")
     date: Optional[str] = Field(None, description="Assessment date")
 
 
-class ClinicalData(BaseModel):
+class ClinicalData(_RAPBase):
     """Clinical or health-related information."""
 
-    model_config = ConfigDict(populate_by_name=True)
-
-    diagnosis: Optional[List[str]] = Field(None, description="Clinical diagnoses")
+    diagnosis: Optional[Tuple[str, ...]] = None
+    """Clinical diagnoses"""
     medication_history: Optional[List[Medication]] = Field(
         None, alias="medicationHistory", description="Medication history"
     )
-    assessments: Optional[List[Assessment]] = Field(
-        None, description="Clinical assessment scores"
-    )
+    assessments: Optional[List[Assessment]] = None
+    """Clinical assessment scores"""
 
 
-class ProductsAvailable(BaseModel):
+class ProductsAvailable(_RAPBase):
     """Summary of available data products for this participant."""
 
-    model_config = ConfigDict(populate_by_name=True)
-
     count: Optional[int] = Field(None, ge=0, description="Total number of products")
-    measures: Optional[List[str]] = Field(
-        None, description="Types of measurements available"
-    )
-    sessions: Optional[List[str]] = Field(None, description="Sessions with data")
+    measures: Optional[Tuple[str, ...]] = None
+    """Types of measurements available"""
+    sessions: Optional[Tuple[str, ...]] = None
+    """Sessions with data"""
     by_measure: Optional[Dict[str, int]] = Field(
         None,
         alias="byMeasure",
@@ -106,20 +109,18 @@ class ProductsAvailable(BaseModel):
     )
 
 
-class SessionDuration(BaseModel):
+@dataclass(config=_VALUE_CONFIG, frozen=True, slots=True)
+class SessionDuration:
     """Session duration."""
 
-    model_config = ConfigDict(populate_by_name=True)
-
     value: Optional[float] = Field(None, description="Duration value")
     unit: str = Field(default="MIN", description="Duration unit")
 
 
-class Environment(BaseModel):
+@dataclass(config=_VALUE_CONFIG, frozen=True, slots=True)
+class Environment:
     """Environmental conditions."""
 
-    model_config = ConfigDict(populate_by_name=True)
-
     temperature: Optional[float] = Field(None, description="Temperature")
     lighting: Optional[str] = Field(None, description="Lighting conditions")
     noise_level: Optional[str] = Field(
@@ -127,38 +128,36 @@ class Environment(BaseModel):
     )
 
 
-class SessionMetadata(BaseModel):
+class SessionMetadata(_RAPBase):
     """Metadata about an experimental session."""
 
-    model_config = ConfigDict(populate_by_name=True)
-
-    session: Optional[str] = Field(None, description="Session identifier")
-    date: Optional[str] = Field(None, description="Session date")
-    duration: Optional[SessionDuration] = Field(None, description="Session duration")
-    notes: Optional[str] = Field(None, description="Session notes")
-    experimenter: Optional[str] = Field(None, description="Experimenter name")
-    environment: Optional[Environment] = Field(
-        None, description="Environmental conditions"
-    )
-
-
-class Links(BaseModel):
+    session: Optional[str] = None
+    """Session identifier"""
+    date: Optional[str] = None
+    """Session date"""
+    duration: Optional[SessionDuration] = None
+    """Session duration"""
+    notes: Optional[str] = None
+    """Session notes"""
+    experimenter: Optional[str] = None
+    """Experimenter name"""
+    environment: Optional[Environment] = None
+    """Environmental conditions"""
+
+
+class Links(_RAPBase):
     """Links to related resources."""
 
-    model_config = ConfigDict(populate_by_name=True)
-
-    products: Optional[HttpUrl] = Field(
+    products: Optional[URLStr] = Field(
         None, description="Link to all products for this participant"
     )
-    measures: Optional[HttpUrl] = Field(None, description="Link to available measures")
-    sessions: Optional[HttpUrl] = Field(None, description="Link to session metadata")
+    measures: Optional[URLStr] = Field(None, description="Link to available measures")
+    sessions: Optional[URLStr] = Field(None, description="Link to session metadata")
 
 
-class Consent(BaseModel):
+class Consent(_RAPBase):
     """Information about consent and data sharing."""
 
-    model_config = ConfigDict(populate_by_name=True)
-
     consent_date: Optional[str] = Field(
         None, alias="consentDate", description="Consent date"
     )
@@ -168,12 +167,11 @@ class Consent(BaseModel):
     data_sharing: Optional[Literal["public", "restricted", "private"]] = Field(
         None, alias="dataSharing", description="Level of data sharing permitted"
     )
-    restrictions: Optional[List[str]] = Field(
-        None, description="Specific restrictions on data use"
-    )
+    restrictions: Optional[Tuple[str, ...]] = None
+    """Specific restrictions on data use"""
 
 
-class Participant(BaseModel):
+class Participant(JsonLdEntityMixin):
     """A research participant with associated demographic data and available products.
 
     Contains demographic information, clinical data, consent information,
@@ -181,22 +179,14 @@ class Participant(BaseModel):
     """
 
     model_config = ConfigDict(
-        populate_by_name=True,
-        json_schema_extra={
-            "$schema": "https://json-schema.org/draft/2020-12/schema",
-            "$id": "https://rap-spec.evidencepub.io/v1/schemas/participant.json",
-        },
-    )
-
-    context: Union[Literal["https://rap-spec.evidencepub.io/v1/context"], Dict[str, Any]] = Field(
-        ..., alias="@context"
-    )
-    type_: Literal["Participant"] = Field(default="Participant", alias="@type")
-    id_: HttpUrl = Field(..., alias="@id", description="Unique URI for this participant")
-    identifier: str = Field(
-        ...,
-        description="Participant ID (e.g., sub-01, P001)",
-        pattern=r"^[A-Za-z0-9_-]+$",
+        defer_build=True,
+        json_schema_extra=schema_metadata("participant.json"),
+    )
+
+    type_: Literal["Participant"] = type_tag("Participant")
+    id_: URLStr = Field(..., alias=ID_ALIAS, description="Unique URI for this participant")
+    identifier: ParticipantID = Field(
+        ..., description="Participant ID (e.g., sub-01, P001)"
     )
     demographic_data: Optional[DemographicData] = Field(
         None,
@@ -1,46 +1,52 @@
 """Research product schema."""
 
-from typing import Any, Dict, Literal, Optional, Union
-from pydantic import BaseModel, ConfigDict, Field, HttpUrl
+from typing import Literal, Optional, Union
+from pydantic import ConfigDict, Field
+from rap_spec.models._mixins import JsonLdEntityMixin
 from rap_spec.models.common import (
     ComputeEnvironment,
     CreativeWork,
     DataDownload,
+    ID_ALIAS,
+    OpaqueDict,
+    ParticipantID,
+    ProcessingLevel,
     ProcessingProvenance,
     PropertyValue,
     ScholarlyArticle,
+    Sex,
+    URLStr,
+    _RAPBase,
+    schema_metadata,
+    type_tag,
 )
 from rap_spec.measurements.relaxometry_mri import RelaxometryMRIMeasurement
 from rap_spec.measurements.timeseries import TimeseriesMeasurement
 from rap_spec.data_types.vector_data import VectorData
 
 
-class DemographicData(BaseModel):
+class DemographicData(_RAPBase):
     """Demographic information for a participant (embedded reference)."""
 
-    model_config = ConfigDict(populate_by_name=True)
-
-    age: Optional[Dict[str, Any]] = Field(None, description="Age information")
-    sex: Optional[Literal["M", "F", "other", "unknown"]] = Field(
+    age: Optional[OpaqueDict] = Field(None, description="Age information")
+    sex: Optional[Sex] = Field(
         None, description="Biological sex"
     )
     group: Optional[str] = Field(None, description="Experimental group assignment")
 
 
-class ParticipantReference(BaseModel):
+class ParticipantReference(_RAPBase):
     """Reference to a research participant."""
 
-    model_config = ConfigDict(populate_by_name=True)
-
-    type_: Literal["Participant"] = Field(default="Participant", alias="@type")
-    id_: HttpUrl = Field(..., alias="@id", description="Participant URI")
-    identifier: str = Field(..., description="Participant ID")
+    type_: Literal["Participant"] = type_tag("Participant")
+    id_: URLStr = Field(..., alias=ID_ALIAS, description="Participant URI")
+    identifier: ParticipantID = Field(..., description="Participant ID")
     demographic_data: Optional[DemographicData] = Field(
         None, alias="demographicData", description="Demographic information"
     )
 
 
-class ResearchProduct(BaseModel):
+class ResearchProduct(JsonLdEntityMixin):
     """A processed, analysis-ready research data product.
 
     Main entity representing a research data product with measurement metadata,
@@ -48,23 +54,13 @@ class ResearchProduct(BaseModel):
     """
 
     model_config = ConfigDict(
-        populate_by_name=True,
-        json_schema_extra={
-            "$schema": "https://json-schema.org/draft/2020-12/schema",
-            "$id": "https://rap-spec.evidencepub.io/v1/schemas/research-product.json",
-        },
+        defer_build=True,
+        json_schema_extra=schema_metadata("research-product.json"),
     )
 
-    context: Union[Literal["https://rap-spec.evidencepub.io/v1/context"], Dict[str, Any]] = Field(
-        ..., alias="@context"
-    )
-    type_: Literal["ResearchProduct"] = Field(
-        default="ResearchProduct", alias="@type"
-    )
-    id_: HttpUrl = Field(
-        ...,
-        alias="@id",
-        description="Unique URI identifying this research product",
+    type_: Literal["ResearchProduct"] = type_tag("ResearchProduct")
+    id_: URLStr = Field(
+        ..., alias=ID_ALIAS, description="Unique URI identifying this research product"
     )
     identifier: Optional[PropertyValue] = Field(
         None,
@@ -78,7 +74,7 @@ class ResearchProduct(BaseModel):
         "processed_categorical",
         "processed_vector",
     ] = Field(..., alias="productType", description="Type of data product")
-    processing_level: Literal["raw", "preprocessed", "analysis_ready", "aggregated"] = Field(
+    processing_level: ProcessingLevel = Field(
         ..., alias="processingLevel", description="Level of processing applied"
     )
     data: Optional[VectorData] = Field(
@@ -91,6 +87,7 @@ class ResearchProduct(BaseModel):
     )
     measurement: Union[RelaxometryMRIMeasurement, TimeseriesMeasurement] = Field(
         ...,
+        discriminator="measurement_type",
         description="Measurement details",
     )
     provenance: Optional[ProcessingProvenance] = Field(
@@ -114,7 +111,7 @@ class ResearchProduct(BaseModel):
         None,
         description="Citation to related publication",
     )
-    quality_metrics: Optional[Dict[str, Any]] = Field(
+    quality_metrics: Optional[OpaqueDict] = Field(
         None,
         alias="qualityMetrics",
         description="Quality assessment metrics",
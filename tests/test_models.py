@@ -0,0 +1,274 @@
+"""Model behaviour tests, with a representative payload for each root model.
+
+The payloads guard against config changes (such as forbidding unknown keys)
+silently rejecting documents the published schemas accept.
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Type
+
+import pytest
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+import rap_spec
+from rap_spec.data_types.vector_data import Statistics, VectorData
+from rap_spec.models.collection import (
+    AppliedFilters,
+    PaginationLinks,
+    ProductSummary,
+    ResearchProductCollection,
+    SortedBy,
+    validate_members,
+)
+from rap_spec.models.common import ProcessingStep, QuantityValue, Unit
+from rap_spec.models.participant import (
+    Age,
+    Assessment,
+    Consent,
+    Environment,
+    Links,
+    Medication,
+    SessionDuration,
+)
+from rap_spec.models.research_product import ResearchProduct
+
+EXAMPLES_DIR = Path(__file__).resolve().parent.parent / "examples"
+CONTEXT = "https://rap-spec.evidencepub.io/v1/context"
+BASE_URL = "https://study.example.com/api/v1"
+
+PAYLOADS: Dict[str, Dict[str, Any]] = {
+    "ResearchProduct": json.loads(
+        (EXAMPLES_DIR / "relaxometry-mri" / "product-sub-01-t1-ses-01-gm.jsonld").read_text()
+    ),
+    "Participant": {
+        "@context": CONTEXT,
+        "@type": "Participant",
+        "@id": f"{BASE_URL}/participants/sub-01",
+        "identifier": "sub-01",
+        "demographicData": {"age": {"value": 32, "unit": "YR"}, "sex": "F"},
+    },
+    "ResearchProductCollection": {
+        "@context": CONTEXT,
+        "@type": "ResearchProductCollection",
+        "@id": f"{BASE_URL}/products",
+        "totalItems": 1,
+        "member": [
+            {
+                "@type": "ResearchProduct",
+                "@id": f"{BASE_URL}/products/sub-01-t1",
+                "identifier": "sub-01-t1",
+            }
+        ],
+    },
+    "AggregateStatistics": {
+        "@context": CONTEXT,
+        "@type": "AggregateStatistics",
+        "@id": f"{BASE_URL}/aggregates/t1",
+        "measure": "t1_relaxation_time",
+        "aggregates": [{"statistics": {"mean": 1200.5, "std": 85.2}}],
+    },
+    "ResearchAPIDescriptor": {
+        "@context": CONTEXT,
+        "paper": {"doi": "10.1234/example.2024", "title": "Example study"},
+        "api": {"version": "1.0.0", "rapSpecVersion": "1.0", "baseUrl": BASE_URL},
+        "endpoints": [{"path": "/products", "methods": ["GET"]}],
+    },
+    "BaseMeasurement": {
+        "measurementType": "timeseries",
+        "specificMeasure": "eeg",
+    },
+    "RelaxometryMRIMeasurement": {
+        "measurementType": "relaxometry_mri",
+        "specificMeasure": "t1_relaxation_time",
+    },
+    "TimeseriesMeasurement": {
+        "measurementType": "timeseries",
+        "specificMeasure": "eeg",
+        "samplingRate": {"value": 256, "unit": {"symbol": "Hz"}},
+    },
+    "VectorData": {
+        "values": [1180.0, 1210.5, 1195.25],
+        "unit": {"@type": "Unit", "symbol": "ms"},
+    },
+}
+
+# Root models carrying a JSON-LD @context and @type
+RAP_MODELS = (
+    "ResearchProduct",
+    "Participant",
+    "ResearchProductCollection",
+    "AggregateStatistics",
+    "ResearchAPIDescriptor",
+)
+# Root models built on _RAPBase's extra="forbid"; the rest ignore unknown keys
+STRICT_MODELS = tuple(name for name in RAP_MODELS if name != "AggregateStatistics")
+
+# Minimal payloads for the nested value objects that forbid unknown keys
+STRICT_VALUE_OBJECTS: Dict[Any, Dict[str, Any]] = {
+    Unit: {"symbol": "ms"},
+    QuantityValue: {"value": 1.0, "unit": "ms"},
+    Age: {"value": 32},
+    Environment: {"temperature": 21.5},
+    SessionDuration: {"value": 45},
+    PaginationLinks: {"next": f"{BASE_URL}/products?page=2"},
+    SortedBy: {"field": "identifier", "order": "asc"},
+    Links: {"products": f"{BASE_URL}/participants/sub-01/products"},
+    Consent: {"dataSharing": "public"},
+    Medication: {"name": "none"},
+    Assessment: {"name": "MoCA", "score": 28},
+}
+
+
+def _model(name: str) -> Type[BaseModel]:
+    model: Type[BaseModel] = getattr(rap_spec, name)
+    return model
+
+
+def test_every_root_model_has_a_payload() -> None:
+    assert sorted(PAYLOADS) == sorted(rap_spec.__all__)
+
+
+@pytest.mark.parametrize("name", sorted(PAYLOADS))
+def test_payload_validates(name: str) -> None:
+    _model(name).model_validate(PAYLOADS[name])
+
+
+@pytest.mark.parametrize("name", sorted(PAYLOADS))
+def test_payload_round_trips(name: str) -> None:
+    model = _model(name)
+    instance = model.model_validate(PAYLOADS[name])
+    dumped = instance.model_dump(mode="json", by_alias=True, exclude_none=True)
+    assert model.model_validate(dumped) == instance
+
+
+@pytest.mark.parametrize("name", sorted(STRICT_MODELS))
+def test_unknown_key_is_rejected(name: str) -> None:
+    with pytest.raises(ValidationError):
+        _model(name).model_validate({**PAYLOADS[name], "unexpectedKey": True})
+
+
+@pytest.mark.parametrize("name", sorted(set(PAYLOADS) - set(STRICT_MODELS)))
+def test_unknown_key_is_ignored(name: str) -> None:
+    instance = _model(name).model_validate({**PAYLOADS[name], "unexpectedKey": True})
+    assert "unexpectedKey" not in instance.model_dump(by_alias=True)
+
+
+@pytest.mark.parametrize("cls", STRICT_VALUE_OBJECTS, ids=lambda cls: cls.__name__)
+def test_value_object_rejects_unknown_key(cls: Any) -> None:
+    adapter: TypeAdapter[Any] = TypeAdapter(cls)
+    adapter.validate_python(STRICT_VALUE_OBJECTS[cls])
+    with pytest.raises(ValidationError):
+        adapter.validate_python({**STRICT_VALUE_OBJECTS[cls], "unexpectedKey": True})
+
+
+def _vector(values: List[float]) -> VectorData:
+    return VectorData.model_validate({"values": values, "unit": {"symbol": "ms"}})
+
+
+def test_vector_statistics_are_filled_on_validation() -> None:
+    vector = _vector([1.0, 2.0, 3.0])
+    assert vector.statistics == Statistics.from_values([1.0, 2.0, 3.0])
+    assert vector.length == 3
+    assert VectorData.model_validate(vector.model_dump()) == vector
+
+
+def test_vector_statistics_survive_exclude_options() -> None:
+    vector = _vector([1.0, 2.0, 3.0])
+    expected = vector.model_dump()["statistics"]
+    assert vector.model_dump(exclude_none=True)["statistics"] == expected
+    assert vector.model_dump(exclude_unset=True)["statistics"] == expected
+
+
+def test_vector_copy_carries_no_hidden_statistics() -> None:
+    vector = _vector([1.0, 2.0, 3.0])
+    copy = vector.model_copy(update={"values": [10.0, 20.0], "length": None, "statistics": None})
+    assert copy.model_dump()["statistics"] is None
+    revalidated = VectorData.model_validate(copy.model_dump())
+    assert revalidated.statistics is not None
+    assert (revalidated.statistics.mean, revalidated.statistics.count) == (15.0, 2)
+
+
+def test_vector_values_serialize_when_not_validated() -> None:
+    vector = _vector([1.0, 2.0, 3.0])
+    constructed = VectorData.model_construct(values=[1.0, 2.0], unit=vector.unit)
+    assert constructed.model_dump()["values"] == [1.0, 2.0]
+    copy = vector.model_copy(update={"values": [4.0]})
+    assert json.loads(copy.model_dump_json())["values"] == [4.0]
+
+
+@pytest.mark.parametrize("name", sorted(RAP_MODELS))
+def test_wrong_context_is_rejected(name: str) -> None:
+    with pytest.raises(ValidationError):
+        _model(name).model_validate({**PAYLOADS[name], "@context": "nope"})
+
+
+@pytest.mark.parametrize("name", sorted(RAP_MODELS))
+def test_wrong_type_is_rejected(name: str) -> None:
+    with pytest.raises(ValidationError):
+        _model(name).model_validate({**PAYLOADS[name], "@type": "UnknownType"})
+
+
+def test_wrong_nested_type_is_rejected() -> None:
+    with pytest.raises(ValidationError):
+        VectorData.model_validate({"values": [1.0], "unit": {"@type": "Thing", "symbol": "ms"}})
+
+
+def test_opaque_dict_requires_an_object() -> None:
+    step = {"stepOrder": 1, "name": "segmentation"}
+    parameters = {"threshold": 0.5, "atlas": {"name": "aseg", "version": [7, 1]}}
+    validated = ProcessingStep.model_validate({**step, "parameters": parameters})
+    assert validated.parameters is parameters
+    with pytest.raises(ValidationError, match="dict_type"):
+        ProcessingStep.model_validate({**step, "parameters": "oops"})
+
+
+SUMMARY = PAYLOADS["ResearchProductCollection"]["member"][0]
+
+
+@pytest.mark.parametrize(
+    "raw, expected",
+    [
+        ([], []),
+        ([PAYLOADS["ResearchProduct"]] * 2, [ResearchProduct, ResearchProduct]),
+        ([SUMMARY] * 2, [ProductSummary, ProductSummary]),
+        ([PAYLOADS["ResearchProduct"], SUMMARY], [ResearchProduct, ProductSummary]),
+        ([SUMMARY, PAYLOADS["ResearchProduct"]], [ProductSummary, ResearchProduct]),
+    ],
+    ids=["empty", "products", "summaries", "product-first", "summary-first"],
+)
+def test_validate_members_picks_member_types(raw: List[Any], expected: List[type]) -> None:
+    assert [type(member) for member in validate_members(raw)] == expected
+
+
+def test_validate_members_reports_invalid_members() -> None:
+    with pytest.raises(ValidationError):
+        validate_members([SUMMARY, {**SUMMARY, "unexpectedKey": True}])
+
+
+def test_iter_members_validates_lazily() -> None:
+    raw = [PAYLOADS["ResearchProduct"], SUMMARY, {"unexpectedKey": True}]
+    members = ResearchProductCollection.iter_members(raw)
+    assert isinstance(next(members), ResearchProduct)
+    assert isinstance(next(members), ProductSummary)
+    with pytest.raises(ValidationError):
+        next(members)
+
+
+@pytest.mark.parametrize("name", sorted(RAP_MODELS))
+def test_from_json_bytes_matches_model_validate(name: str) -> None:
+    model = getattr(rap_spec, name)
+    raw = json.dumps(PAYLOADS[name]).encode()
+    assert model.from_json_bytes(raw) == model.model_validate(PAYLOADS[name])
+    assert model.from_json_bytes(bytearray(raw)) == model.model_validate(PAYLOADS[name])
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [("sub-01", ("sub-01",)), (["sub-01", "sub-02"], ("sub-01", "sub-02")), (None, None)],
+    ids=["string", "list", "none"],
+)
+def test_filter_list_normalizes_to_tuple(value: Any, expected: Any) -> None:
+    filters = AppliedFilters.model_validate({"participant": value})
+    assert filters.participant == expected
+    assert AppliedFilters.model_validate(filters.model_dump()) == filters